@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Extract every Brigham Young discourse from the complete Journal of
+Discourses markdown into a single summary file
+"""
+import mmap
+import re
+
+INPUT_FILE = 'Journal_of_Discourses_Complete.md'
+OUTPUT_FILE = 'extraction-summaries/Brigham_Young_Discourses.md'
+
+# Bytes patterns: the input is scanned as a read-only mmap, so the whole
+# file is never decoded or copied into a Python str
+_SPLIT_RE = re.compile(rb'\n---\n')
+_SPEAKER_RE = re.compile(rb'\*\*Speaker:\*\*.*BRIGHAM YOUNG', re.IGNORECASE)
+
+def remove_discourse_numbers(content):
+    """Strip the per-volume "## Discourse N" headings from a block"""
+    # Fixed-prefix deletion: a line-wise startswith/isdigit filter beats a
+    # MULTILINE regex pass over the whole block
+    lines = content.split('\n')
+    out = []
+    i = 0
+    while i < len(lines):
+        if (lines[i].startswith('## Discourse ') and lines[i][13:].isdigit()
+                and i + 1 < len(lines) and lines[i + 1] == ''):
+            i += 2
+            continue
+        out.append(lines[i])
+        i += 1
+    return '\n'.join(out)
+
+def extract_brigham_young_discourses(input_file=INPUT_FILE, output_file=OUTPUT_FILE):
+    """Extract Brigham Young discourses and write the summary file.
+
+    The complete file is mapped read-only and segmented by its ---
+    separators with finditer; each segment is scanned in place (pos/endpos
+    search, no slicing) and only the matching discourses are ever decoded,
+    one at a time, as they are written out. The --- separators are ASCII
+    newline-delimited, so segment boundaries never split a UTF-8 sequence.
+    """
+    with open(input_file, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        spans = []
+        prev = 0
+        for m in _SPLIT_RE.finditer(mm):
+            spans.append((prev, m.start()))
+            prev = m.end()
+        spans.append((prev, len(mm)))
+
+        matched = [(s, e) for s, e in spans if _SPEAKER_RE.search(mm, s, e)]
+
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as out:
+            out.write("# Discourses of the Prophet Brigham Young\n\n")
+            out.write(f"*{len(matched)} discourses extracted the Journal of Discourses (Volumes 1-26)*\n")
+            for s, e in matched:
+                discourse = remove_discourse_numbers(
+                    mm[s:e].decode('utf-8').strip('\n'))
+                out.write("\n---\n\n")
+                out.write(discourse)
+                out.write("\n")
+
+    print(f"Extracted {len(matched)} Brigham Young discourses to {output_file}")
+    return len(matched)
+
+if __name__ == "__main__":
+    extract_brigham_young_discourses()
@@ -3,16 +3,94 @@
 Clean extraction of Journal of Discourses PDF to Markdown
 Uses structural analysis rather than keyword matching
 """
+import os
 import re
-import pypdf
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+import pypdfium2 as pdfium
+
+# Precompiled patterns. These run on nearly every line of every page, so
+# compile them once at import time instead of going through re's internal
+# pattern cache on each call.
+_RE_JOD_HEADER = re.compile(r'^\d+\s+JOURNAL OF DISCOURSES\.$')
+_RE_RUNNING_HEADER = re.compile(r"^[A-Z\s\-',]+\.\s+\d+\s*$")
+_RE_TRAIL_PGNUM = re.compile(r'\.\s+\d{2,3}$')
+_RE_HYPHEN_EOL = re.compile(r'(\w+)-\s*$')
+_RE_HYPHEN_SPLIT = re.compile(r'(\w+)-\s+(\w+)')
+_DATE_PATTERN = r'([A-Z]+\s+\d{1,2}(?:TH|ST|ND|RD)?,\s+\d{4})'
+_RE_DATE = re.compile(_DATE_PATTERN)
+
+# Single alternations so one scan replaces a Python-level loop over patterns
+_SPEAKER_PATTERN = (
+    r'\bBY\s+(?:PRESIDENT|ELDER|HON\.|ESQ\.|MR\.|PROFESSOR)'
+    r'|\bPRESIDENT\s+[A-Z]'
+    r'|\bELDER\s+[A-Z]'
+    r'|\bHON\.\s+[A-Z]'
+    r'|\bESQ\.\s*,'
+    r'|\bDELIVERED\s+BY'
+    r'|\bBEFORE\s+THE\s+HON\.'
+)
+_SPEAKER_RE = re.compile(_SPEAKER_PATTERN)
+
+_LOCATION_PATTERN = (
+    r'\bDELIVERED\s+(?:IN|AT)'
+    r'|\bGREAT\s+SALT\s+LAKE'
+    r'|\bTABERNACLE'
+)
+_LOCATION_RE = re.compile(_LOCATION_PATTERN)
+
+# One leftmost match classifies each metadata line; lastgroup names the
+# bucket, replacing separate reporter/date/speaker/location probes per line
+_META_CLASSIFIER = re.compile(
+    r'(?P<reporter>^REPORTED BY)'
+    rf'|(?P<date>{_DATE_PATTERN})'
+    rf'|(?P<speaker>{_SPEAKER_PATTERN})'
+    rf'|(?P<location>{_LOCATION_PATTERN})'
+)
+
+_SPEAKER_NAME_PATTERNS = tuple(re.compile(p) for p in (
+    r'BY\s+((?:PRESIDENT|ELDER|HON\.|ESQ\.|MR\.|PROFESSOR)\s+[A-Z\s\.]+?)(?:,|\s+DELIVERED|\s+BEFORE|\s+ON)',
+    r'((?:PRESIDENT|ELDER|HON\.|ESQ\.)\s+[A-Z\s\.]+?)(?:,|\s+DELIVERED|\s+BEFORE)',
+    r'BY\s+([A-Z\s\.]+?)(?:,|\s+DELIVERED|\s+BEFORE)',
+))
+
+_RE_NAME_GAP = re.compile(r'(?<=\s)([A-Z])\s+([A-Z]{2,})')
+_RE_NAME_GAP_AFTER_DOT = re.compile(r'(?<=\.)(\s*)([A-Z])\s+([A-Z]{2,})')
+_RE_B_YOUNG = re.compile(r'\bB\.\s*YOUNG\b')
+_RE_HC_KIMBALL = re.compile(r'H\.\s*C\.\s*KIMBALL')
+_RE_PP_PRATT = re.compile(r'\bP\.\s*P\.\s*PRATT\b')
+
+_RE_LOCATION = re.compile(r'(?:DELIVERED|AT|IN|BEFORE)\s+(?:THE\s+)?([A-Z\s,\.]+?)(?=,\s*[A-Z]+\s+\d|$|REPORTED)')
+_RE_COMMA_DOT = re.compile(r'\s*,\s*\.')
+_RE_DOUBLE_COMMA = re.compile(r',\s*,')
+_RE_MULTI_SPACE = re.compile(r'\s+')
+
+_RE_VOLUME_NUM = re.compile(r'JoD(\d+)')
+
+# Closing "Amen" lines to skip when collecting title blocks
+_AMEN_TOKENS = frozenset(("AMEN", "AMEN.", "AMEN!"))
+
+def _extract_one_page(pdf_path, page_num):
+    """Extract text from a single page (runs in a worker process)"""
+    pdf = pdfium.PdfDocument(pdf_path)
+    return pdf[page_num].get_textpage().get_text_range()
+
+def extract_pdf_pages(pdf_path, parallel=True):
+    """Extract text from each page, fanning pages out across CPU cores"""
+    num_pages = len(pdfium.PdfDocument(pdf_path))
+
+    # Text extraction dominates runtime and is independent per page,
+    # so dispatch pages to worker processes; map preserves page order
+    if parallel:
+        with ProcessPoolExecutor() as executor:
+            texts = list(executor.map(partial(_extract_one_page, pdf_path),
+                                      range(num_pages)))
+    else:
+        texts = [_extract_one_page(pdf_path, n) for n in range(num_pages)]
 
-def extract_pdf_pages(pdf_path):
-    """Extract text from each page"""
-    reader = pypdf.PdfReader(pdf_path)
     pages = []
-
-    for page_num, page in enumerate(reader.pages):
-        text = page.extract_text()
+    for page_num, text in enumerate(texts):
         pages.append({
             'number': page_num + 1,
             'text': text,
@@ -31,18 +109,26 @@ def is_page_header_footer(line):
     if line.isdigit():
         return True
 
-    if re.match(r'^\d+\s+JOURNAL OF DISCOURSES\.$', line):
-        return True
+    # Most lines are ordinary prose; check the last character before
+    # paying for a regex match.
+    last = line[-1]
 
-    if line == "JOURNAL OF DISCOURSES.":
-        return True
+    if last == '.':
+        if line == "JOURNAL OF DISCOURSES.":
+            return True
+        if line[0].isdigit() and _RE_JOD_HEADER.match(line):
+            return True
 
     # Running header with page number: "TITLE. ###"
-    if re.match(r'^[A-Z\s\-\',]+\.\s+\d+\s*$', line):
+    if last.isdigit() and _RE_RUNNING_HEADER.match(line):
         return True
 
     return False
 
+def ends_with_page_number(line):
+    """Check if line ends with a running-header page number ("TITLE. ###")"""
+    return bool(line) and line[-1].isdigit() and _RE_TRAIL_PGNUM.search(line) is not None
+
 def clean_page_text(page_lines):
     """Clean a single page's lines"""
     cleaned = []
@@ -60,8 +146,10 @@ def fix_hyphenation(lines):
     while i < len(lines):
         line = lines[i]
 
-        if i + 1 < len(lines):
-            match = re.search(r'(\w+)-\s*$', line)
+        # Lines are pre-stripped, so a one-character endswith test rejects
+        # the overwhelming majority before the regex runs
+        if line.endswith('-') and i + 1 < len(lines):
+            match = _RE_HYPHEN_EOL.search(line)
             if match:
                 next_line = lines[i + 1].strip()
                 if next_line and next_line[0].islower():
@@ -80,50 +168,60 @@ def find_discourse_boundaries(lines):
     """
     Find discourse boundaries by looking for ALL CAPS blocks with speaker names.
     More flexible than keyword matching.
+
+    Lines are expected to be pre-stripped (clean_page_text strips them),
+    so no per-probe .strip() copies are made here.
     """
     boundaries = []
     last_boundary_end = -1  # Track last found boundary to avoid overlaps
 
+    # One pass of setup so the backward/forward scans below are plain array
+    # lookups instead of repeated .isupper()/regex calls on the same lines
+    upper = [l.isupper() for l in lines]
+    running_hdr = [ends_with_page_number(l) for l in lines]
+
     i = 0
     while i < len(lines):
         # Skip if we're too close to the last boundary (avoid duplicates)
         if i < last_boundary_end + 3:
             i += 1
             continue
-        line = lines[i].strip()
+        line = lines[i]
 
         # Skip empty lines, "Amen", and other non-content
-        if line in ["", "AMEN", "AMEN."]:
+        if not line or line in _AMEN_TOKENS:
             i += 1
             continue
 
         # Check if this line is ALL CAPS and looks like it could be part of a title/header
-        if not line.isupper() or len(line) < 5:
+        if not upper[i] or len(line) < 5:
             i += 1
             continue
 
         # Skip running headers with page numbers
-        if re.search(r'\.\s+\d{2,3}$', line):
+        if running_hdr[i]:
             i += 1
             continue
 
         # Found an ALL CAPS line - collect the full title block
         title_lines = []
+        title_seen = set()  # O(1) duplicate check for the forward scan
         start_idx = i
 
         # Look backward to see if there are more title lines (skip Amen)
         lookback = i - 1
         while lookback >= 0:
-            prev_line = lines[lookback].strip()
+            prev_line = lines[lookback]
             # Skip empty lines and "Amen"
-            if prev_line in ["", "AMEN", "AMEN."]:
+            if not prev_line or prev_line in _AMEN_TOKENS:
                 lookback -= 1
                 continue
             # Add valid title line (but never include AMEN even if part of line)
-            if prev_line.isupper() and len(prev_line) > 3 and not re.search(r'\.\s+\d{2,3}$', prev_line):
+            if upper[lookback] and len(prev_line) > 3 and not running_hdr[lookback]:
                 # Don't add lines that contain AMEN
-                if "AMEN" not in prev_line:
+                if prev_line not in _AMEN_TOKENS:
                     title_lines.insert(0, prev_line)
+                    title_seen.add(prev_line)
                     start_idx = lookback
                 lookback -= 1
             else:
@@ -132,22 +230,23 @@ def find_discourse_boundaries(lines):
         # Now collect forward
         j = i
         while j < len(lines):
-            curr_line = lines[j].strip()
+            curr_line = lines[j]
 
             # Skip if it's a running header or empty
-            if not curr_line or re.search(r'\.\s+\d{2,3}$', curr_line):
+            if not curr_line or running_hdr[j]:
                 j += 1
                 if j - i > 10:  # Don't look too far
                     break
                 continue
 
             # If line is all caps, add to title block (but skip AMEN)
-            if curr_line.isupper():
+            if upper[j]:
                 # Don't add lines containing AMEN
-                if curr_line not in title_lines and "AMEN" not in curr_line:
+                if curr_line not in title_seen and curr_line not in _AMEN_TOKENS:
                     title_lines.append(curr_line)
+                    title_seen.add(curr_line)
                 # Skip AMEN lines entirely
-                elif "AMEN" in curr_line:
+                elif curr_line in _AMEN_TOKENS:
                     j += 1
                     continue
                 j += 1
@@ -162,7 +261,7 @@ def find_discourse_boundaries(lines):
                     # (unless it's a legal document with "BEFORE THE HON.")
                     verified = False
                     for k in range(j, min(j + 8, len(lines))):
-                        check_line = lines[k].strip()
+                        check_line = lines[k]
                         if 'REPORTED BY' in check_line:
                             verified = True
                             break
@@ -186,7 +285,7 @@ def find_discourse_boundaries(lines):
                     # Still need to verify with REPORTED BY
                     verified = False
                     for k in range(j, min(j + 8, len(lines))):
-                        check_line = lines[k].strip()
+                        check_line = lines[k]
                         if 'REPORTED BY' in check_line or ('BEFORE THE HON.' in check_line and 'JUDGE' in check_line):
                             verified = True
                             break
@@ -207,37 +306,19 @@ def find_discourse_boundaries(lines):
 
     return boundaries
 
+@lru_cache(maxsize=4096)
 def has_speaker_indicator(line):
     """Check if line contains a speaker indicator"""
-    speaker_patterns = [
-        r'\bBY\s+(?:PRESIDENT|ELDER|HON\.|ESQ\.|MR\.|PROFESSOR)',
-        r'\bPRESIDENT\s+[A-Z]',
-        r'\bELDER\s+[A-Z]',
-        r'\bHON\.\s+[A-Z]',
-        r'\bESQ\.\s*,',
-        r'\bDELIVERED\s+BY',
-        r'\bBEFORE\s+THE\s+HON\.',
-    ]
-    for pattern in speaker_patterns:
-        if re.search(pattern, line):
-            return True
-    return False
+    return _SPEAKER_RE.search(line) is not None
 
+@lru_cache(maxsize=4096)
 def has_location_indicator(line):
     """Check if line contains a location indicator"""
-    location_patterns = [
-        r'\bDELIVERED\s+(?:IN|AT)',
-        r'\bGREAT\s+SALT\s+LAKE',
-        r'\bTABERNACLE',
-    ]
-    for pattern in location_patterns:
-        if re.search(pattern, line):
-            return True
-    return False
+    return _LOCATION_RE.search(line) is not None
 
 def has_date(line):
     """Check if line contains a date"""
-    return bool(re.search(r'[A-Z]+\s+\d{1,2}(?:TH|ST|ND|RD)?,\s+\d{4}', line))
+    return bool(_RE_DATE.search(line))
 
 def extract_metadata_from_block(lines, start_idx, end_idx):
     """Extract title, speaker, location, date from a discourse block"""
@@ -249,33 +330,34 @@ def extract_metadata_from_block(lines, start_idx, end_idx):
         'reporter': ''
     }
 
-    # Collect all the metadata lines
-    block_lines = [lines[i].strip() for i in range(start_idx, min(end_idx + 5, len(lines)))
-                   if lines[i].strip()]
+    # Collect all the metadata lines (already stripped upstream)
+    block_lines = [lines[i] for i in range(start_idx, min(end_idx + 5, len(lines)))
+                   if lines[i]]
 
     title_parts = []
     speaker_parts = []
     location_parts = []
 
     for line in block_lines:
-        # Check for reporter
-        if line.startswith('REPORTED BY'):
+        # One classifier pass buckets the line; dates embedded in speaker or
+        # location lines are recovered later by extract_location_and_date
+        match = _META_CLASSIFIER.search(line)
+        kind = match.lastgroup if match else None
+
+        if kind == 'reporter':
             metadata['reporter'] = line.replace('REPORTED BY', '').strip().rstrip('.')
             break
 
-        # Check for date
-        date_match = re.search(r'([A-Z]+\s+\d{1,2}(?:TH|ST|ND|RD)?,\s+\d{4})', line)
-        if date_match and not metadata['date']:
-            metadata['date'] = date_match.group(1)
-
-        # Check if this line has speaker info
-        if has_speaker_indicator(line):
+        if kind == 'speaker':
             speaker_parts.append(line)
-        elif has_location_indicator(line):
+        elif kind == 'location':
             location_parts.append(line)
+        elif kind == 'date':
+            if not metadata['date']:
+                metadata['date'] = match.group('date')
         elif not metadata['date'] and line.isupper() and 'BEFORE' not in line:
             # Likely part of title (but skip AMEN)
-            if not re.search(r'\.\s+\d{2,3}$', line) and 'AMEN' not in line:  # Not a running header or AMEN
+            if not ends_with_page_number(line) and line not in _AMEN_TOKENS:  # Not a running header or AMEN
                 title_parts.append(line.rstrip('.'))
 
     # Parse speaker from speaker_parts
@@ -301,14 +383,8 @@ def extract_metadata_from_block(lines, start_idx, end_idx):
 def extract_speaker_name(text):
     """Extract speaker name from text"""
     # Try various patterns
-    patterns = [
-        r'BY\s+((?:PRESIDENT|ELDER|HON\.|ESQ\.|MR\.|PROFESSOR)\s+[A-Z\s\.]+?)(?:,|\s+DELIVERED|\s+BEFORE|\s+ON)',
-        r'((?:PRESIDENT|ELDER|HON\.|ESQ\.)\s+[A-Z\s\.]+?)(?:,|\s+DELIVERED|\s+BEFORE)',
-        r'BY\s+([A-Z\s\.]+?)(?:,|\s+DELIVERED|\s+BEFORE)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in _SPEAKER_NAME_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).strip().rstrip(',.')
 
@@ -317,14 +393,14 @@ def extract_speaker_name(text):
 def normalize_speaker_name(speaker):
     """Normalize speaker names for consistency"""
     # Fix spacing issues (e.g., "G EORGE A. S MITH" -> "GEORGE A. SMITH")
-    speaker = re.sub(r'(?<=\s)([A-Z])\s+([A-Z]{2,})', r'\1\2', speaker)
-    speaker = re.sub(r'(?<=\.)(\s*)([A-Z])\s+([A-Z]{2,})', r'\1\2\3', speaker)
+    speaker = _RE_NAME_GAP.sub(r'\1\2', speaker)
+    speaker = _RE_NAME_GAP_AFTER_DOT.sub(r'\1\2\3', speaker)
 
     # Normalize abbreviated names
-    speaker = re.sub(r'\bB\.\s*YOUNG\b', 'BRIGHAM YOUNG', speaker)
-    speaker = re.sub(r'H\.\s*C\.\s*KIMBALL', 'HEBER C. KIMBALL', speaker)
+    speaker = _RE_B_YOUNG.sub('BRIGHAM YOUNG', speaker)
+    speaker = _RE_HC_KIMBALL.sub('HEBER C. KIMBALL', speaker)
     speaker = speaker.replace('H. C. KIMBALL', 'HEBER C. KIMBALL')
-    speaker = re.sub(r'\bP\.\s*P\.\s*PRATT\b', 'PARLEY P. PRATT', speaker)
+    speaker = _RE_PP_PRATT.sub('PARLEY P. PRATT', speaker)
 
     # Add ELDER if missing title
     if speaker == "PARLEY P. PRATT":
@@ -347,7 +423,7 @@ def extract_location_and_date(text):
     date = ''
 
     # Extract date first
-    date_match = re.search(r'([A-Z]+\s+\d{1,2}(?:TH|ST|ND|RD)?,\s+\d{4})', text)
+    date_match = _RE_DATE.search(text)
     if date_match:
         date = date_match.group(1)
         # Remove date from text for location parsing
@@ -355,14 +431,14 @@ def extract_location_and_date(text):
 
     # Extract location
     # Look for pattern after DELIVERED/AT/IN/BEFORE
-    location_match = re.search(r'(?:DELIVERED|AT|IN|BEFORE)\s+(?:THE\s+)?([A-Z\s,\.]+?)(?=,\s*[A-Z]+\s+\d|$|REPORTED)', text)
+    location_match = _RE_LOCATION.search(text)
     if location_match:
         location = location_match.group(1).strip()
 
     # Clean up location
-    location = re.sub(r'\s*,\s*\.', '', location)
-    location = re.sub(r',\s*,', ',', location)
-    location = re.sub(r'\s+', ' ', location)
+    location = _RE_COMMA_DOT.sub('', location)
+    location = _RE_DOUBLE_COMMA.sub(',', location)
+    location = _RE_MULTI_SPACE.sub(' ', location)
     location = location.strip(',. ')
 
     return location, date
@@ -383,32 +459,16 @@ def find_all_discourses(lines):
         # Get content
         content_lines = lines[content_start:content_end]
 
-        # Remove title repetitions and any ALL CAPS lines from title block
+        # Remove title repetitions and any ALL CAPS lines from title block.
+        # Title remnants only ever appear at the head of a discourse, so
+        # drop the leading ALL CAPS lines instead of filtering every line
         if metadata['title']:
-            # Split title into parts for better matching
-            title_parts = set()
-            title_parts.add(metadata['title'])
-            title_parts.add(metadata['title'] + '.')
-            # Also add individual lines from title in case they appear
-            for part in metadata['title'].split():
-                if len(part) > 3:
-                    title_parts.add(part)
-
-            # Filter out title lines and any ALL CAPS lines at the start
-            filtered_lines = []
-            started_content = False
-            for l in content_lines:
-                line_stripped = l.strip()
-                # Once we hit lowercase content, we've started the actual discourse
-                if not line_stripped.isupper() or started_content:
-                    started_content = True
-                    # Still check if it's an exact title match
-                    if line_stripped not in [metadata['title'], metadata['title'] + '.']:
-                        filtered_lines.append(l)
-                # Skip ALL CAPS lines that might be title remnants
-                elif not any(part in line_stripped for part in ['REPORTED BY', 'DELIVERED']):
-                    continue
-            content_lines = filtered_lines
+            head_cut = 0
+            limit = min(len(content_lines), 20)
+            while (head_cut < limit and content_lines[head_cut]
+                   and content_lines[head_cut].isupper()):
+                head_cut += 1
+            content_lines = content_lines[head_cut:]
 
         # Join paragraphs
         content = join_paragraphs(content_lines)
@@ -426,13 +486,12 @@ def join_paragraphs(lines):
     current = []
 
     for i, line in enumerate(lines):
-        line = line.strip()
-
         if not line:
             # Empty line = definite paragraph break
             if current:
                 para_text = ' '.join(current)
-                para_text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', para_text)
+                if '-' in para_text:
+                    para_text = _RE_HYPHEN_SPLIT.sub(r'\1\2', para_text)
                 paragraphs.append(para_text)
                 current = []
         else:
@@ -450,7 +509,8 @@ def join_paragraphs(lines):
                 if ends_sentence and starts_new and len(current) > 2:
                     # Save current paragraph
                     para_text = ' '.join(current)
-                    para_text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', para_text)
+                    if '-' in para_text:
+                        para_text = _RE_HYPHEN_SPLIT.sub(r'\1\2', para_text)
                     paragraphs.append(para_text)
                     current = [line]
                 else:
@@ -460,57 +520,49 @@ def join_paragraphs(lines):
 
     if current:
         para_text = ' '.join(current)
-        para_text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', para_text)
+        if '-' in para_text:
+            para_text = _RE_HYPHEN_SPLIT.sub(r'\1\2', para_text)
         paragraphs.append(para_text)
 
     return '\n\n'.join(paragraphs)
 
-def format_markdown(discourses):
-    """Format as markdown"""
-    md = "# JOURNAL OF DISCOURSES - VOLUME 1\n\n"
+def write_markdown(discourses, volume_title, file_obj):
+    """Write the formatted markdown for a volume to an open file object"""
+    write = file_obj.write
+    write(f"# {volume_title}\n\n")
 
     for i, discourse in enumerate(discourses, 1):
         meta = discourse['metadata']
         content = discourse['content']
 
-        md += "---\n\n"
-        md += f"## Discourse {i}\n\n"
+        write("---\n\n")
+        write(f"## Discourse {i}\n\n")
 
         if meta['title']:
-            md += f"# {meta['title']}\n\n"
+            write(f"# {meta['title']}\n\n")
 
         if meta['speaker']:
-            md += f"**Speaker:** {meta['speaker']}  \n"
+            write(f"**Speaker:** {meta['speaker']}  \n")
 
         if meta['location'] or meta['date']:
-            md += "**Delivered:** "
+            write("**Delivered:** ")
             if meta['location']:
-                md += meta['location']
+                write(meta['location'])
             if meta['location'] and meta['date']:
-                md += ", "
+                write(", ")
             if meta['date']:
-                md += meta['date']
-            md += "  \n"
+                write(meta['date'])
+            write("  \n")
 
         if meta['reporter']:
-            md += f"**Reported by:** {meta['reporter']}  \n"
-
-        md += f"\n{content}\n\n"
-
-    return md
-
-def main():
-    import sys
+            write(f"**Reported by:** {meta['reporter']}  \n")
 
-    # Get PDF filename from command line, or default to JoD01.pdf
-    if len(sys.argv) > 1:
-        pdf_file = sys.argv[1]
-    else:
-        pdf_file = 'JoD01.pdf'
+        write(f"\n{content}\n\n")
 
+def process_one_pdf(pdf_file, parallel_pages=True):
+    """Run the full extraction pipeline for a single PDF volume"""
     # Determine volume number and output filename
-    import re
-    match = re.search(r'JoD(\d+)', pdf_file)
+    match = _RE_VOLUME_NUM.search(pdf_file)
     if match:
         volume_num = match.group(1)
         output_file = f'JoD{volume_num}_clean.md'
@@ -521,7 +573,7 @@ def main():
 
     print(f"Processing {pdf_file}...")
     print("Extracting pages from PDF...")
-    pages = extract_pdf_pages(pdf_file)
+    pages = extract_pdf_pages(pdf_file, parallel=parallel_pages)
     print(f"Extracted {len(pages)} pages")
 
     print("Cleaning page text...")
@@ -539,49 +591,33 @@ def main():
     discourses = find_all_discourses(all_lines)
     print(f"Found {len(discourses)} discourses")
 
-    print("Formatting markdown...")
-    # Update format_markdown to accept volume title
-    markdown = format_markdown_with_title(discourses, volume_title)
-
     print(f"Writing output to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(markdown)
-
-    print(f"\nDone! Created {output_file} with {len(discourses)} discourses")
-
-def format_markdown_with_title(discourses, volume_title):
-    """Format as markdown with custom volume title"""
-    md = f"# {volume_title}\n\n"
-
-    for i, discourse in enumerate(discourses, 1):
-        meta = discourse['metadata']
-        content = discourse['content']
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_markdown(discourses, volume_title, f)
 
-        md += "---\n\n"
-        md += f"## Discourse {i}\n\n"
+    # Drop memoized title-line results so they don't carry across volumes
+    has_speaker_indicator.cache_clear()
+    has_location_indicator.cache_clear()
 
-        if meta['title']:
-            md += f"# {meta['title']}\n\n"
-
-        if meta['speaker']:
-            md += f"**Speaker:** {meta['speaker']}  \n"
+    print(f"\nDone! Created {output_file} with {len(discourses)} discourses")
 
-        if meta['location'] or meta['date']:
-            md += "**Delivered:** "
-            if meta['location']:
-                md += meta['location']
-            if meta['location'] and meta['date']:
-                md += ", "
-            if meta['date']:
-                md += meta['date']
-            md += "  \n"
+def main():
+    import sys
+    from glob import glob
 
-        if meta['reporter']:
-            md += f"**Reported by:** {meta['reporter']}  \n"
+    # Process the PDFs named on the command line, or every volume here
+    pdf_files = sys.argv[1:] or sorted(glob('JoD*.pdf'))
 
-        md += f"\n{content}\n\n"
+    if len(pdf_files) <= 1:
+        for pdf_file in pdf_files or ['JoD01.pdf']:
+            process_one_pdf(pdf_file)
+        return
 
-    return md
+    # One volume per worker saturates the cores already, so page-level
+    # parallelism is turned off inside the workers to avoid nested pools
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(partial(process_one_pdf, parallel_pages=False),
+                          pdf_files))
 
 if __name__ == "__main__":
     main()